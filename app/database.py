@@ -1,17 +1,39 @@
 """
 In-memory database for the Bookstore API
 
-Why a dictionary instead of a list?
-- O(1) lookups by ID vs O(n) scanning
-- More closely mirrors real databases (key-value)
-- Easier to prevent duplicate IDs
+Why a list indexed by ID instead of a dictionary?
+- IDs are handed out densely from 1, so the ID *is* the list position
+- O(1) lookups by ID are a direct array index, with no hashing
+- No per-key hash table slot; a deleted book just leaves a None behind
+
+Why also keep columns (price, availability) next to the rows?
+- Filtering walks one packed array instead of every row object
+- NumPy compares the whole price column in a single vectorized sweep
+- Prices are indexed as uint32 cents: half the bytes of a float64, and
+  integer comparisons have no rounding surprises
 
 Interview tip: "In production, this would be PostgreSQL with
 SQLAlchemy ORM or an async driver like asyncpg"
 """
 
-from typing import Dict, List, Optional
-from app.models import Book, BookCreate, BookUpdate
+import os
+import pickle
+from array import array
+from decimal import Decimal
+from hashlib import blake2b
+from itertools import count
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from app.models import (
+    MAX_PRICE_CENTS,
+    BookCreate,
+    BookRow,
+    BookUpdate,
+    book_encoder,
+    price_to_cents,
+)
 
 
 class BookDatabase:
@@ -24,9 +46,33 @@ class BookDatabase:
     - Testable with mock databases
     """
 
-    def __init__(self):
-        self._books: Dict[int, Book] = {}
-        self._next_id: int = 1
+    def __init__(self, engine: Optional[Any] = None):
+        """
+        Args:
+            engine: Connection pool / SQLAlchemy engine for a real backend.
+                None (the default) keeps everything in memory. Build one
+                with the pool sizes from app.settings.engine_kwargs().
+        """
+        self._engine = engine
+        # Slot 0 is never used: IDs start at 1 and _books[id] is that book
+        self._books: List[Optional[BookRow]] = [None]
+        # Encoded JSON of each row, same slots as _books. Rebuilding the list
+        # payload joins these instead of re-encoding every field of every row
+        self._row_json: List[Optional[bytes]] = [None]
+        self._count: int = 0
+        # The increment happens inside next() in C, so there's no window
+        # between "read current id" and "bump counter" for a race to hit
+        self._id_gen = count(1)
+        # Serialized GET /books payload + its ETag, rebuilt lazily after writes
+        self._all_json_cache: Optional[bytes] = None
+        self._all_etag: Optional[str] = None
+
+        # Columnar (SoA) scan index: position i of every column describes
+        # the same book. Rows stay in _books for O(1) lookups by ID.
+        self._ids = array("q")
+        self._price_cents = array("I")  # uint32
+        self._available = array("b")
+        self._id_to_idx: Dict[int, int] = {}
 
     def _generate_id(self) -> int:
         """
@@ -35,11 +81,46 @@ class BookDatabase:
         Production note: Real DBs handle this with AUTO_INCREMENT
         or SERIAL columns.
         """
-        current_id = self._next_id
-        self._next_id += 1
-        return current_id
+        return next(self._id_gen)
+
+    def _invalidate_cache(self) -> None:
+        """Drop the cached list payload. Call on every write."""
+        self._all_json_cache = None
+        self._all_etag = None
+
+    def _index_add(self, book: BookRow) -> None:
+        """Append a book to the scan columns"""
+        self._id_to_idx[book.id] = len(self._ids)
+        self._ids.append(book.id)
+        self._price_cents.append(price_to_cents(book.price))
+        self._available.append(book.available)
 
-    def create(self, book_data: BookCreate) -> Book:
+    def _index_update(self, book: BookRow) -> None:
+        """Refresh a book's scan columns after an update"""
+        idx = self._id_to_idx[book.id]
+        self._price_cents[idx] = price_to_cents(book.price)
+        self._available[idx] = book.available
+
+    def _index_remove(self, book_id: int) -> None:
+        """
+        Drop a book from the scan columns.
+
+        Swap-remove: the last entry moves into the hole, so columns stay
+        packed and deletion is O(1) instead of shifting every element.
+        """
+        idx = self._id_to_idx.pop(book_id)
+        last = len(self._ids) - 1
+        if idx != last:
+            moved_id = self._ids[last]
+            self._ids[idx] = moved_id
+            self._price_cents[idx] = self._price_cents[last]
+            self._available[idx] = self._available[last]
+            self._id_to_idx[moved_id] = idx
+        self._ids.pop()
+        self._price_cents.pop()
+        self._available.pop()
+
+    def create(self, book_data: BookCreate) -> BookRow:
         """
         Create a new book with auto-generated ID.
 
@@ -47,35 +128,101 @@ class BookDatabase:
             book_data: Book info from user (no ID)
 
         Returns:
-            Complete Book object with ID
+            Stored BookRow with its ID
         """
         book_id = self._generate_id()
-        book = Book(
-            id=book_id,
-            **book_data.model_dump()  # Converts Pydantic model to dict
-        )
-        self._books[book_id] = book
+        # Copy the already-validated fields straight across (no dict dump)
+        book = BookRow(id=book_id, **book_data.__dict__)
+        # IDs come from a counter that only create() advances, so the new
+        # ID is always the next free slot
+        self._books.append(book)
+        self._row_json.append(book_encoder.encode(book))
+        self._count += 1
+        self._index_add(book)
+        self._invalidate_cache()
         return book
 
-    def get_all(self) -> List[Book]:
+    def get_all(self) -> List[BookRow]:
         """
         Retrieve all books.
 
         Interview tip: "In production, I'd add pagination to handle
         thousands of records: GET /books?page=1&limit=50"
         """
-        return list(self._books.values())
+        return [b for b in self._books if b is not None]
+
+    def get_all_json(self) -> bytes:
+        """
+        Retrieve all books as a ready-to-send JSON array.
+
+        Reads vastly outnumber writes in a bookstore, so the payload is
+        serialized once and reused until the next create/update/delete.
+        """
+        if self._all_json_cache is None:
+            payload = b"[" + b",".join(
+                [j for j in self._row_json if j is not None]
+            ) + b"]"
+            self._all_json_cache = payload
+            self._all_etag = f'"{blake2b(payload, digest_size=8).hexdigest()}"'
+        return self._all_json_cache
+
+    def get_all_etag(self) -> str:
+        """ETag for the current get_all_json() payload (content hash)"""
+        if self._all_etag is None:
+            self.get_all_json()
+        return self._all_etag
+
+    def filter(
+        self,
+        max_price: Optional[float] = None,
+        available: Optional[bool] = None
+    ) -> List[BookRow]:
+        """
+        Retrieve books matching every given filter, in ID order.
 
-    def get_by_id(self, book_id: int) -> Optional[Book]:
+        The predicates run over the packed columns with NumPy, e.g.
+        "books under $X" is one vectorized comparison, not a Python loop.
+        """
+        # Zero-copy views over the array buffers; they're released before
+        # returning, so the columns can still grow afterwards
+        mask = np.ones(len(self._ids), dtype=np.bool_)
+        if max_price is not None:
+            # Floor to whole cents via Decimal: a $10.005 ceiling must not
+            # admit a $10.01 book the way float * 100 rounding might
+            max_cents = min(int(Decimal(str(max_price)) * 100), MAX_PRICE_CENTS)
+            prices = np.frombuffer(self._price_cents, dtype=np.uint32)
+            mask &= prices <= max_cents
+        if available is not None:
+            mask &= np.frombuffer(self._available, dtype=np.bool_) == available
+        ids = np.sort(np.frombuffer(self._ids, dtype=np.int64)[mask])
+        return [self._books[book_id] for book_id in ids.tolist()]
+
+    def get_by_id(self, book_id: int) -> Optional[BookRow]:
         """
         Retrieve a single book by ID.
 
         Returns:
-            Book if found, None otherwise (cleaner than exceptions here)
+            BookRow if found, None otherwise (cleaner than exceptions here)
+        """
+        if 0 < book_id < len(self._books):
+            return self._books[book_id]
+        return None
+
+    def get_json_by_id(self, book_id: int) -> Optional[bytes]:
         """
-        return self._books.get(book_id)
+        Retrieve a single book as encoded JSON.
+
+        The bytes were rendered when the book was last written, so
+        serving them costs no encoding at all.
 
-    def update(self, book_id: int, book_data: BookUpdate) -> Optional[Book]:
+        Returns:
+            JSON bytes if found, None otherwise
+        """
+        if 0 < book_id < len(self._row_json):
+            return self._row_json[book_id]
+        return None
+
+    def update(self, book_id: int, book_data: BookUpdate) -> Optional[BookRow]:
         """
         Update an existing book (partial update).
 
@@ -86,16 +233,23 @@ class BookDatabase:
         Returns:
             Updated book or None if not found
         """
-        book = self._books.get(book_id)
-        if not book:
+        book = self.get_by_id(book_id)
+        if book is None:
             return None
 
-        # Update only provided fields (exclude_unset=True)
-        update_data = book_data.model_dump(exclude_unset=True)
-        updated_book = book.model_copy(update=update_data)
-        self._books[book_id] = updated_book
+        # Update only the fields the client actually sent, in place.
+        # The stored row never leaves this process, so there's no need to
+        # allocate a fresh copy on every update.
+        # (an explicit null means "leave unchanged", never "erase")
+        fields_set = book_data.__pydantic_fields_set__
+        for field, value in book_data.__dict__.items():
+            if field in fields_set and value is not None:
+                setattr(book, field, value)
+        self._row_json[book_id] = book_encoder.encode(book)
+        self._index_update(book)
+        self._invalidate_cache()
 
-        return updated_book
+        return book
 
     def delete(self, book_id: int) -> bool:
         """
@@ -104,18 +258,74 @@ class BookDatabase:
         Returns:
             True if deleted, False if not found
         """
-        if book_id in self._books:
-            del self._books[book_id]
-            return True
-        return False
+        # One bounds check + one slot read decides it; no separate
+        # exists()/get_by_id() round trip before the write
+        books = self._books
+        if not (0 < book_id < len(books)) or books[book_id] is None:
+            return False
+        books[book_id] = None
+        self._row_json[book_id] = None
+        self._count -= 1
+        self._index_remove(book_id)
+        self._invalidate_cache()
+        return True
 
     def exists(self, book_id: int) -> bool:
         """Check if a book exists"""
-        return book_id in self._books
+        return self.get_by_id(book_id) is not None
 
     def count(self) -> int:
         """Return total number of books"""
-        return len(self._books)
+        return self._count
+
+    def save_snapshot(self, path: str) -> None:
+        """
+        Write all books to a pickle file at `path`.
+
+        Writes to a temp file first, then os.replace() swaps it in, so a
+        crash mid-write never leaves a truncated snapshot behind.
+        """
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(self._books, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+
+    def load_snapshot(self, path: str) -> bool:
+        """
+        Replace the contents of the database with a snapshot from `path`.
+
+        The GET /books payload is rebuilt right away, so the first request
+        after a restart is served from a warm cache.
+
+        Only load snapshots this service wrote itself - unpickling runs
+        arbitrary code from the file.
+
+        Returns:
+            True if a snapshot was loaded, False if none exists
+        """
+        try:
+            with open(path, "rb") as f:
+                books: List[Optional[BookRow]] = pickle.load(f)
+        except FileNotFoundError:
+            return False
+
+        self._books = books
+        self._row_json = [
+            None if book is None else book_encoder.encode(book) for book in books
+        ]
+        self._count = 0
+        self._id_gen = count(len(books))
+        self._ids = array("q")
+        self._price_cents = array("I")
+        self._available = array("b")
+        self._id_to_idx = {}
+        for book in books:
+            if book is not None:
+                self._count += 1
+                self._index_add(book)
+        self._invalidate_cache()
+        self.get_all_json()  # pre-warm
+        return True
 
 
 # Global database instance
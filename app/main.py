@@ -11,12 +11,59 @@ Interview tip: "In microservices, each service would have its own
 main.py. In monoliths, you'd have multiple routers imported here."
 """
 
-from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from contextlib import asynccontextmanager
+
+import orjson
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
+from app.database import db
 from app.routes import router as books_router
+from app.settings import settings
+
+# Where the book set is saved on shutdown and reloaded on startup
+SNAPSHOT_PATH = settings.SNAPSHOT_PATH
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Startup runs before the yield, shutdown after it.
+
+    Startup use cases:
+    - Initialize database connections
+    - Load ML models
+    - Start background tasks
+    - Warm up caches
+
+    Shutdown use cases:
+    - Close database connections
+    - Flush logs
+    - Cancel background tasks
+    - Save state
+
+    Interview tip: "I'd use this to create DB connection pools
+    with SQLAlchemy or async drivers."
+    """
+    print("🚀 Bookstore API starting up...")
+    try:
+        if db.load_snapshot(SNAPSHOT_PATH):
+            print(f"📦 Restored {db.count()} books from {SNAPSHOT_PATH}")
+    except Exception as exc:
+        # Unpickling a corrupt file can raise almost anything; a bad
+        # snapshot shouldn't keep the API from booting
+        print(f"⚠️ Could not load snapshot {SNAPSHOT_PATH}: {exc}")
+
+    yield
+
+    print("👋 Bookstore API shutting down...")
+    try:
+        db.save_snapshot(SNAPSHOT_PATH)
+    except OSError as exc:
+        print(f"⚠️ Could not save snapshot {SNAPSHOT_PATH}: {exc}")
+
 
 # Create the FastAPI application
 app = FastAPI(
@@ -25,6 +72,8 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",  # Swagger UI
     redoc_url="/redoc",  # ReDoc alternative UI
+    default_response_class=ORJSONResponse,  # orjson instead of stdlib json
+    lifespan=lifespan,  # replaces the deprecated @app.on_event hooks
 )
 
 
@@ -68,9 +117,26 @@ async def http_exception_handler(request: Request, exc: StarletteHTTPException):
 app.include_router(books_router) # Adds all /books routes
 
 
+# These bodies never change, so encode them once at import instead of
+# building and serializing a dict on every load balancer probe
+_ROOT_BYTES = orjson.dumps({
+    "message": "📚 Welcome to the Bookstore API",
+    "version": "1.0.0",
+    "docs": "/docs",
+    "endpoints": {
+        "books": "/books",
+        "health": "/health"
+    }
+})
+_HEALTH_BYTES = orjson.dumps({
+    "status": "healthy",
+    "service": "bookstore-api"
+})
+
+
 # Root endpoint
 @app.get("/", tags=["root"])
-def read_root():
+async def read_root():
     """
     Health check / welcome endpoint.
 
@@ -79,19 +145,11 @@ def read_root():
     - GET /version - for deployment tracking
     - GET /metrics - for Prometheus monitoring"
     """
-    return {
-        "message": "📚 Welcome to the Bookstore API",
-        "version": "1.0.0",
-        "docs": "/docs",
-        "endpoints": {
-            "books": "/books",
-            "health": "/health"
-        }
-    }
+    return Response(_ROOT_BYTES, media_type="application/json")
 
 
 @app.get("/health", tags=["root"])
-def health_check():
+async def health_check():
     """
     Health check endpoint for monitoring systems.
 
@@ -100,43 +158,7 @@ def health_check():
     - External API availability
     - Disk space, memory usage
     """
-    return {
-        "status": "healthy",
-        "service": "bookstore-api"
-    }
-
-
-# Startup event
-@app.on_event("startup")
-async def startup_event():
-    """
-    Runs once when the server starts.
-
-    Use cases:
-    - Initialize database connections
-    - Load ML models
-    - Start background tasks
-    - Warm up caches
-
-    Interview tip: "I'd use this to create DB connection pools
-    with SQLAlchemy or async drivers."
-    """
-    print("🚀 Bookstore API starting up...")
-
-
-# Shutdown event
-@app.on_event("shutdown")
-async def shutdown_event():
-    """
-    Runs when the server shuts down gracefully.
-
-    Use cases:
-    - Close database connections
-    - Flush logs
-    - Cancel background tasks
-    - Save state
-    """
-    print("👋 Bookstore API shutting down...")
+    return Response(_HEALTH_BYTES, media_type="application/json")
 
 
 # For running with: python -m app.main
@@ -148,5 +170,11 @@ if __name__ == "__main__":
         host="0.0.0.0",  # Accept connections from any IP
         port=8000,
         reload=True,  # Auto-reload on code changes (dev only!)
-        log_level="info"
+        log_level="info",
+        loop="uvloop",  # libuv event loop instead of stock asyncio
+        http="httptools",  # C HTTP parser instead of pure-Python h11
+        backlog=2048,  # Pending-connection queue for traffic bursts
+        timeout_keep_alive=30,  # Reuse client connections for longer
+        access_log=False,  # Skip a logging format call on every request
+        # No workers=N: each process would get its own in-memory db
     )
\ No newline at end of file
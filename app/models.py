@@ -6,11 +6,33 @@ Why separate models?
 - BookCreate: What users send (no ID)
 - Book: What API returns (with ID)
 - BookUpdate: Optional fields for PATCH (future-proofing)
+- BookRow: Slim storage record kept by BookDatabase (msgspec, not Pydantic)
+
+Pydantic guards the public input contract (BookCreate/BookUpdate); the
+read path stores and emits msgspec structs, which skip validation and
+encode in a single C call.
 """
 
-from pydantic import BaseModel, Field
+import msgspec
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from typing import Optional
 
+# Prices are fixed-precision currency. BookDatabase indexes them as whole
+# cents in a uint32 column, which caps a price at $42,949,672.95.
+MAX_PRICE_CENTS = 2**32 - 1
+MIN_PRICE = 0.01
+MAX_PRICE = MAX_PRICE_CENTS / 100
+
+
+def price_to_cents(price: float) -> int:
+    """Convert a (cent-quantized) price to integer cents"""
+    return round(price * 100)
+
+
+def _quantize_price(price: Optional[float]) -> Optional[float]:
+    """Round incoming prices to whole cents so floats never drift"""
+    return None if price is None else round(price, 2)
+
 
 class BookBase(BaseModel):
     """Shared properties across all book models"""
@@ -18,9 +40,12 @@ class BookBase(BaseModel):
                        description="Book title")
     author: str = Field(..., min_length=1, max_length=100,
                         description="Author name")
-    price: float = Field(..., gt=0, description="Price must be positive")
+    price: float = Field(..., ge=MIN_PRICE, le=MAX_PRICE,
+                         description="Price must be positive (rounded to cents)")
     available: bool = Field(default=True, description="Availability status")
 
+    _round_price = field_validator("price")(_quantize_price)
+
 
 class BookCreate(BookBase):
     """
@@ -41,9 +66,11 @@ class BookUpdate(BaseModel):
     """
     title: Optional[str] = Field(None, min_length=1, max_length=200)
     author: Optional[str] = Field(None, min_length=1, max_length=100)
-    price: Optional[float] = Field(None, gt=0)
+    price: Optional[float] = Field(None, ge=MIN_PRICE, le=MAX_PRICE)
     available: Optional[bool] = None
 
+    _round_price = field_validator("price")(_quantize_price)
+
 
 class Book(BookBase):
     """
@@ -52,11 +79,14 @@ class Book(BookBase):
     """
     id: int = Field(..., description="Unique book identifier")
 
-    class Config:
-        # Allows Pydantic to work with ORM objects (future SQLAlchemy integration)
-        from_attributes = True
+    model_config = ConfigDict(
+        # Only used as the response schema now; storage is BookRow below
+        from_attributes=False,
+        extra="forbid",
+        validate_assignment=False,
+        arbitrary_types_allowed=False,
         # Example for API documentation
-        json_schema_extra = {
+        json_schema_extra={
             "example": {
                 "id": 1,
                 "title": "Clean Code",
@@ -64,4 +94,31 @@ class Book(BookBase):
                 "price": 29.99,
                 "available": True
             }
-        }
\ No newline at end of file
+        },
+    )
+
+
+class BookRow(msgspec.Struct, gc=False):
+    """
+    In-memory storage record for a book.
+
+    Why not store Book itself?
+    - Every Pydantic instance carries a __dict__ plus
+      __pydantic_fields_set__; a Struct uses __slots__ and carries neither
+    - Input is validated once as BookCreate/BookUpdate, so stored rows
+      never need the validator machinery again
+    - gc=False: rows only hold scalars, so they can never form reference
+      cycles and the garbage collector can skip them
+
+    Field order matches Book's so the JSON output is unchanged.
+    """
+    title: str
+    author: str
+    price: float
+    available: bool
+    id: int
+
+
+# Built once per process and reused; encode() handles a BookRow or a list
+# of them without any per-field Python dispatch.
+book_encoder = msgspec.json.Encoder()
\ No newline at end of file
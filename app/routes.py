@@ -7,12 +7,48 @@ Why separate from main.py?
 - Easier testing: import routes without starting server
 """
 
-from fastapi import APIRouter, HTTPException, status
-from typing import List
+from fastapi import APIRouter, Header, Query, Response, status
+from typing import List, Optional
 
-from app.models import Book, BookCreate, BookUpdate
+import orjson
+
+from app.models import Book, BookCreate, BookUpdate, book_encoder
 from app.database import db
 
+# Handlers are `async def`: they only touch the in-memory store, so they never
+# block, and FastAPI can run them on the event loop instead of handing each
+# request to the threadpool.
+
+# 404 body encoded once at import. Misses return it directly instead of
+# raising HTTPException and unwinding through the exception handlers.
+_NOT_FOUND_TEMPLATE = orjson.dumps({"detail": "Book not found"})
+
+
+def _not_found() -> Response:
+    """404 for a missing book, built from the pre-encoded body"""
+    return Response(
+        content=_NOT_FOUND_TEMPLATE,
+        status_code=status.HTTP_404_NOT_FOUND,
+        media_type="application/json"
+    )
+
+
+def _book_response(
+    payload: bytes, status_code: int = status.HTTP_200_OK
+) -> Response:
+    """
+    JSON response for a single stored book.
+
+    `payload` comes from db.get_json_by_id(): bytes rendered on the
+    book's last write, so returning a book never re-encodes it.
+    """
+    return Response(
+        content=payload,
+        status_code=status_code,
+        media_type="application/json"
+    )
+
+
 # Create a router (sub-application)
 # In larger apps, you'd have: books_router, authors_router, etc.
 router = APIRouter(
@@ -23,12 +59,11 @@ router = APIRouter(
 
 @router.post(
     "/",
-    response_model=Book,
     status_code=status.HTTP_201_CREATED,
     summary="Create a new book",
     description="Add a new book to the bookstore. ID is auto-generated."
 )
-def create_book(book: BookCreate):
+async def create_book(book: BookCreate) -> Book:
     """
     Create a new book with the following information:
 
@@ -40,36 +75,72 @@ def create_book(book: BookCreate):
     Returns the created book with its assigned ID.
     """
     new_book = db.create(book)
-    return new_book
+    # Returning a Response skips FastAPI's jsonable_encoder + response_model
+    # re-validation; the -> Book annotation only feeds the OpenAPI docs.
+    return _book_response(
+        db.get_json_by_id(new_book.id),
+        status_code=status.HTTP_201_CREATED
+    )
 
 
 @router.get(
     "/",
-    response_model=List[Book],
     status_code=status.HTTP_200_OK,
     summary="Get all books",
     description="Retrieve a list of all books in the bookstore."
 )
-def get_books():
+async def get_books(
+    max_price: Optional[float] = Query(
+        None, gt=0, allow_inf_nan=False,
+        description="Only books at or under this price"
+    ),
+    available: Optional[bool] = Query(None, description="Filter by availability"),
+    if_none_match: Optional[str] = Header(None)
+) -> List[Book]:
     """
-    Retrieve all books from the database.
+    Retrieve all books from the database, optionally filtered.
+
+    - **max_price**: Only books priced at or below this value
+    - **available**: Only books with this availability
 
     Interview tip: "In production, I'd implement pagination:
     - Query params: ?page=1&limit=20
     - Response headers: X-Total-Count, Link (for next/prev pages)
     - Consider cursor-based pagination for large datasets"
+
+    The unfiltered list sends an ETag; clients that echo it in
+    If-None-Match get a 304 until the catalog changes.
     """
-    return db.get_all()
+    if max_price is not None or available is not None:
+        books = db.filter(max_price=max_price, available=available)
+        return Response(
+            content=book_encoder.encode(books),
+            media_type="application/json"
+        )
+
+    etag = db.get_all_etag()
+    if if_none_match and (
+        if_none_match.strip() == "*"
+        or etag in (tag.strip() for tag in if_none_match.split(","))
+    ):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={"ETag": etag}
+        )
+    return Response(
+        content=db.get_all_json(),
+        media_type="application/json",
+        headers={"ETag": etag}
+    )
 
 
 @router.get(
     "/{book_id}",
-    response_model=Book,
     status_code=status.HTTP_200_OK,
     summary="Get a book by ID",
     description="Retrieve a specific book using its unique identifier."
 )
-def get_book(book_id: int):
+async def get_book(book_id: int) -> Book:
     """
     Retrieve a single book by ID.
 
@@ -77,23 +148,19 @@ def get_book(book_id: int):
 
     Returns 404 if book doesn't exist.
     """
-    book = db.get_by_id(book_id)
-    if not book:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Book with id {book_id} not found"
-        )
-    return book
+    payload = db.get_json_by_id(book_id)
+    if payload is None:
+        return _not_found()
+    return _book_response(payload)
 
 
 @router.put(
     "/{book_id}",
-    response_model=Book,
     status_code=status.HTTP_200_OK,
     summary="Update a book",
     description="Update all fields of an existing book."
 )
-def update_book(book_id: int, book: BookUpdate):
+async def update_book(book_id: int, book: BookUpdate) -> Book:
     """
     Update an existing book (partial update supported).
 
@@ -106,12 +173,9 @@ def update_book(book_id: int, book: BookUpdate):
     - This endpoint accepts partial updates, so PATCH might be more RESTful
     """
     updated_book = db.update(book_id, book)
-    if not updated_book:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Book with id {book_id} not found"
-        )
-    return updated_book
+    if updated_book is None:
+        return _not_found()
+    return _book_response(db.get_json_by_id(book_id))
 
 
 @router.delete(
@@ -120,7 +184,7 @@ def update_book(book_id: int, book: BookUpdate):
     summary="Delete a book",
     description="Remove a book from the bookstore."
 )
-def delete_book(book_id: int):
+async def delete_book(book_id: int) -> None:
     """
     Delete a book by ID.
 
@@ -133,9 +197,6 @@ def delete_book(book_id: int):
     """
     success = db.delete(book_id)
     if not success:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Book with id {book_id} not found"
-        )
+        return _not_found()
     # FastAPI automatically returns 204 with no content
     return None
\ No newline at end of file
@@ -0,0 +1,54 @@
+"""
+Configuration for the Bookstore API
+
+Why a settings class?
+- One place for every tunable, read from environment variables
+- Values are validated (typos like DB_POOL_SIZE=twenty fail at boot)
+- Moving from the in-memory store to PostgreSQL becomes a config swap
+
+Every field can be overridden with a BOOKSTORE_-prefixed env var, e.g.
+BOOKSTORE_DB_POOL_SIZE=50.
+
+Interview tip: "Default SQLAlchemy pools (pool_size=5, max_overflow=10)
+are a common bottleneck under load - size them explicitly."
+"""
+
+from typing import Any, Dict, Optional
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class Settings(BaseSettings):
+    """Application settings, loaded from the environment"""
+    model_config = SettingsConfigDict(env_prefix="BOOKSTORE_")
+
+    # Where the in-memory book set is saved on shutdown / loaded on startup
+    SNAPSHOT_PATH: str = "/var/cache/books.pkl"
+
+    # Future PostgreSQL backend (e.g. postgresql+asyncpg://...)
+    DATABASE_URL: Optional[str] = None
+    DB_POOL_SIZE: int = 20  # Connections kept open
+    DB_MAX_OVERFLOW: int = 40  # Extra connections allowed under bursts
+    DB_POOL_TIMEOUT: int = 30  # Seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = 3600  # Replace connections older than this
+    DB_POOL_PRE_PING: bool = True  # Detect dead connections before use
+
+    def engine_kwargs(self) -> Dict[str, Any]:
+        """
+        Pool arguments for SQLAlchemy, so the switch to Postgres is:
+
+            engine = create_async_engine(settings.DATABASE_URL,
+                                         **settings.engine_kwargs())
+            db = BookDatabase(engine=engine)
+        """
+        return {
+            "pool_size": self.DB_POOL_SIZE,
+            "max_overflow": self.DB_MAX_OVERFLOW,
+            "pool_timeout": self.DB_POOL_TIMEOUT,
+            "pool_recycle": self.DB_POOL_RECYCLE,
+            "pool_pre_ping": self.DB_POOL_PRE_PING,
+        }
+
+
+# Global settings instance
+settings = Settings()